@@ -6,11 +6,12 @@ import sys
 from pathlib import Path
 
 # Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
 from dataclasses import asdict
 from logging_utils import setup_logging
-from pipeline import PipelineResult, TrelloPipeline
 from scraping import instantiate_scrapers, list_scraper_ids
 
 
@@ -54,6 +55,10 @@ def main() -> None:
             logging.error("Sitios disponibles: %s", ", ".join(list_scraper_ids()))
             sys.exit(1)
 
+    # Imported lazily: the pipeline pulls in the Google/Trello/Slack integrations,
+    # which --help and invalid --sites arguments never need.
+    from pipeline import PipelineResult, TrelloPipeline
+
     pipeline = TrelloPipeline(scrapers=scrapers)
     result: PipelineResult = pipeline.run(limit_per_site=args.limit_per_site, dry_run=args.dry_run)
     print(json.dumps(asdict(result), indent=2, ensure_ascii=False))
@@ -8,7 +8,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 # Ensure src is on the path.
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
 
 from integrations import SlackNotifier
 from logging_utils import setup_logging
@@ -23,15 +23,16 @@ def _optional_env(name: str) -> Optional[str]:
     return value or None
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ScraperSettings:
     user_agent: str
     request_timeout: float
     max_retries: int
     throttle_seconds: float
+    max_workers: int
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class TrelloSettings:
     api_key: str
     token: str
@@ -39,13 +40,13 @@ class TrelloSettings:
     list_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class SlackSettings:
     webhook_url: Optional[str]
     bot_token: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class GoogleSettings:
     project_id: str
     client_email: str
@@ -61,7 +62,7 @@ class GoogleSettings:
     universe_domain: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class Settings:
     scraper: ScraperSettings
     trello: TrelloSettings
@@ -86,6 +87,7 @@ def get_settings() -> Settings:
             request_timeout=float(_optional_env("SCRAPER_REQUEST_TIMEOUT") or 20),
             max_retries=int(_optional_env("SCRAPER_MAX_RETRIES") or 3),
             throttle_seconds=float(_optional_env("SCRAPER_THROTTLE_SECONDS") or 1.5),
+            max_workers=int(_optional_env("SCRAPER_MAX_WORKERS") or 8),
         ),
         trello=TrelloSettings(
             api_key=_require_env("TRELLO_KEY"),
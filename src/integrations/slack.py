@@ -21,6 +21,8 @@ class SlackNotifier:
         settings = get_settings().slack
         self._webhook_url: Optional[str] = settings.webhook_url
         self._bot_token: Optional[str] = settings.bot_token
+        # Reuse one connection pool for every message sent during a run.
+        self._http = httpx.Client()
 
     def notify(self, message: str) -> None:
         stripped = message.strip()
@@ -77,7 +79,7 @@ class SlackNotifier:
             "Content-Type": "application/json; charset=utf-8",
         }
         try:
-            response = httpx.post(SLACK_CHAT_POST_MESSAGE_URL, json=payload, headers=headers, timeout=10)
+            response = self._http.post(SLACK_CHAT_POST_MESSAGE_URL, json=payload, headers=headers, timeout=10)
             response.raise_for_status()
             data = response.json()
             if not data.get("ok", False):
@@ -91,7 +93,7 @@ class SlackNotifier:
 
     def _post_via_webhook(self, payload: dict) -> None:
         try:
-            response = httpx.post(self._webhook_url, json=payload, timeout=10)
+            response = self._http.post(self._webhook_url, json=payload, timeout=10)
             response.raise_for_status()
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to send Slack message via webhook: %s", exc)
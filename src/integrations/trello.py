@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+import random
+import time
 from typing import Optional
 
 import httpx
@@ -10,6 +12,8 @@ from config import TrelloSettings, get_settings
 from models import NewsItem
 
 TRELLO_API_BASE = "https://api.trello.com/1"
+TRELLO_MAX_ATTEMPTS = 4
+TRELLO_BACKOFF_SECONDS = 1.0
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,8 @@ class TrelloClient:
             #"desc": _build_description(item),
             "start": item.published_at.isoformat(),
             "pos": "top",
+            # Attach the article URL in the same request instead of a follow-up call.
+            "urlSource": item.url,
         }
 
         label_id = self._ensure_label(item.source)
@@ -50,7 +56,6 @@ class TrelloClient:
             logger.warning("Trello response missing card ID for %s", item.url)
             return ""
 
-        self._attach_url(card_id, item.url)
         return card_id
 
     # -- Internal helpers -------------------------------------------------
@@ -70,9 +75,33 @@ class TrelloClient:
                 "token": self._settings.token,
             }
         )
-        response = self._http.request(method, f"{TRELLO_API_BASE}{path}", params=params, json=json)
-        response.raise_for_status()
-        return response
+        url = f"{TRELLO_API_BASE}{path}"
+        # Only retry failures where Trello cannot have processed the request
+        # (rate limiting, connection setup), so POSTs never create duplicates.
+        for attempt in range(1, TRELLO_MAX_ATTEMPTS + 1):
+            try:
+                response = self._http.request(method, url, params=params, json=json)
+            except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+                if attempt == TRELLO_MAX_ATTEMPTS:
+                    raise
+                reason = str(exc) or exc.__class__.__name__
+            else:
+                if response.status_code != 429 or attempt == TRELLO_MAX_ATTEMPTS:
+                    response.raise_for_status()
+                    return response
+                reason = "HTTP 429"
+            delay = _backoff_delay(attempt)
+            logger.warning(
+                "Trello %s %s failed (%s); retrying in %.1fs (attempt %d/%d)",
+                method,
+                path,
+                reason,
+                delay,
+                attempt,
+                TRELLO_MAX_ATTEMPTS,
+            )
+            time.sleep(delay)
+        raise RuntimeError(f"Failed to {method} {path}")  # pragma: no cover - loop always returns or raises
 
     def _ensure_label(self, name: str | None) -> Optional[str]:
         if not name:
@@ -82,7 +111,12 @@ class TrelloClient:
 
         # Refresh cache with existing labels
         try:
-            response = self._request("GET", f"/boards/{self._settings.board_id}/labels", params={"limit": 1000})
+            response = self._request(
+                "GET",
+                f"/boards/{self._settings.board_id}/labels",
+                # Only names are needed to resolve labels; ids are always returned.
+                params={"limit": 1000, "fields": "name"},
+            )
             labels = response.json()
             for label in labels:
                 label_name = (label.get("name") or "").strip()
@@ -115,11 +149,12 @@ class TrelloClient:
             logger.warning("Failed to create Trello label '%s': %s", name, exc)
         return None
 
-    def _attach_url(self, card_id: str, url: str) -> None:
-        try:
-            self._request("POST", f"/cards/{card_id}/attachments", params={"url": url})
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Failed to attach URL to card %s: %s", card_id, exc)
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter so concurrent runs do not retry in lockstep."""
+
+    base = TRELLO_BACKOFF_SECONDS * 2 ** (attempt - 1)
+    return base + random.uniform(0, TRELLO_BACKOFF_SECONDS)
 
 
 def _build_description(item: NewsItem) -> str:
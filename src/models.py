@@ -13,8 +13,11 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def url_to_id(url: str) -> str:
-    """Normalize a URL and return a deterministic SHA-1 identifier."""
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "yclid", "mc_cid", "mc_eid", "ref", "ref_src", "igshid"})
+
+
+def normalize_url(url: str) -> str:
+    """Return a canonical form of ``url`` without tracking parameters."""
     try:
         split = urlsplit(url)
         scheme = split.scheme or "https"
@@ -35,17 +38,20 @@ def url_to_id(url: str) -> str:
             lowered = key.lower()
             if lowered.startswith("utm_"):
                 continue
-            if lowered in {"fbclid", "gclid", "yclid", "mc_cid", "mc_eid", "ref", "ref_src", "igshid"}:
+            if lowered in _TRACKING_PARAMS:
                 continue
             params.append((key, value))
         params.sort()
         query = urlencode(params, doseq=True)
 
-        normalized = urlunsplit((scheme, netloc, path, query, ""))
+        return urlunsplit((scheme, netloc, path, query, ""))
     except Exception:  # noqa: BLE001
-        normalized = url
+        return url
 
-    return sha1(normalized.encode("utf-8")).hexdigest()
+
+def url_to_id(url: str) -> str:
+    """Normalize a URL and return a deterministic SHA-1 identifier."""
+    return sha1(normalize_url(url).encode("utf-8")).hexdigest()
 
 
 @dataclass(slots=True, frozen=True)
@@ -77,4 +83,4 @@ class SheetRecord:
     url: str
 
 
-__all__ = ["NewsItem", "SheetRecord", "url_to_id", "utcnow"]
+__all__ = ["NewsItem", "SheetRecord", "normalize_url", "url_to_id", "utcnow"]
@@ -1,11 +1,13 @@
 """Pipeline orchestrating scraping and Trello/Google Sheets integration."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import logging
+from operator import itemgetter
 import os
-from typing import Optional, Sequence
+from typing import Iterator, Optional, Sequence
 
 try:
     from zoneinfo import ZoneInfo
@@ -13,6 +15,7 @@ except ImportError:  # pragma: no cover
     ZoneInfo = None  # type: ignore[assignment]
 
 import httpx
+from config import get_settings
 from integrations import GoogleSheetsRepository, SlackNotifier, TrelloClient
 from models import NewsItem, SheetRecord, utcnow
 from scraping import BaseScraper, SCRAPER_PRIORITY, instantiate_scrapers
@@ -52,11 +55,13 @@ class TrelloPipeline:
         trello_client: Optional[TrelloClient] = None,
         sheets_repo: Optional[GoogleSheetsRepository] = None,
         slack_notifier: Optional[SlackNotifier] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         self._scrapers = list(scrapers) if scrapers else instantiate_scrapers()
         self._trello = trello_client or TrelloClient()
         self._sheets = sheets_repo or GoogleSheetsRepository()
         self._slack = slack_notifier or SlackNotifier()
+        self._max_workers = max_workers or get_settings().scraper.max_workers
 
     def run(
         self,
@@ -76,7 +81,7 @@ class TrelloPipeline:
         logger.info("Loaded %d existing IDs from Google Sheets.", len(existing_ids))
 
         seen_ids = set(existing_ids)
-        pending_items: list[NewsItem] = []
+        pending_items: list[tuple[tuple[datetime, int, str, str], str, NewsItem]] = []
         records_to_append: list[SheetRecord] = []
         total_items = 0
         new_items = 0
@@ -86,23 +91,21 @@ class TrelloPipeline:
         sources_processed = 0
         stale_cutoff = utcnow() - timedelta(days=10)
 
-        for scraper in self._scrapers:
-            logger.info("Processing source: %s", scraper.site_id)
-            try:
-                items = scraper.scrape(limit=limit_per_site)
-            except ScraperNoArticlesError as exc:
+        for scraper, items, error in self._scrape_all(limit_per_site):
+            logger.info("Collecting results for source: %s", scraper.site_id)
+            if isinstance(error, ScraperNoArticlesError):
                 alerts_sent += 1
                 message = (
-                    f":rotating_light: El scraper '{exc.site_id}' no retornó URLs. "
+                    f":rotating_light: El scraper '{error.site_id}' no retornó URLs. "
                     "Revisa posibles cambios en la web origen."
                 )
                 logger.warning(message)
                 self._slack.notify(message)
                 continue
-            except Exception as exc:  # noqa: BLE001
-                logger.exception("Unexpected error scraping %s", scraper.site_id)
+            if error is not None:
+                logger.error("Unexpected error scraping %s", scraper.site_id, exc_info=error)
                 alerts_sent += 1
-                self._slack.notify(_format_scraper_error(scraper.site_id, exc))
+                self._slack.notify(_format_scraper_error(scraper.site_id, error))
                 continue
 
             sources_processed += 1
@@ -118,19 +121,21 @@ class TrelloPipeline:
                     )
                     continue
 
-                if item.doc_id in seen_ids:
+                doc_id = item.doc_id
+                if doc_id in seen_ids:
                     skipped_existing += 1
                     continue
 
                 logger.info("New item detected: %s %s", item.source, item.url)
-                seen_ids.add(item.doc_id)
+                seen_ids.add(doc_id)
                 new_items += 1
-                pending_items.append(item)
+                # Resolve the sort key once; its timestamp also dates the sheet row.
+                pending_items.append((_item_sort_key(item), doc_id, item))
 
-        ordered_items = sorted(pending_items, key=_item_sort_key)
+        pending_items.sort(key=itemgetter(0))
 
         if not dry_run:
-            for item in ordered_items:
+            for sort_key, doc_id, item in pending_items:
                 try:
                     card_id = self._trello.create_card(item)
                     logger.info("Created Trello card %s for %s", card_id or "<unknown>", item.url)
@@ -143,8 +148,8 @@ class TrelloPipeline:
 
                 records_to_append.append(
                     SheetRecord(
-                        date=_resolve_item_date(item),
-                        doc_id=item.doc_id,
+                        date=sort_key[0].date().isoformat(),
+                        doc_id=doc_id,
                         source=item.source,
                         title=item.title,
                         url=item.url,
@@ -178,6 +183,28 @@ class TrelloPipeline:
         self._send_summary(result, dry_run=dry_run)
         return result
 
+    def _scrape_all(
+        self, limit_per_site: Optional[int]
+    ) -> Iterator[tuple[BaseScraper, list[NewsItem], Exception | None]]:
+        """Scrape every source concurrently, yielding outcomes in registry order.
+
+        Scraping is dominated by network latency, so sources are fetched in a
+        bounded thread pool while results are still consumed sequentially to
+        keep logging, alerts and item ordering deterministic.
+        """
+
+        def scrape(scraper: BaseScraper) -> tuple[list[NewsItem], Exception | None]:
+            logger.info("Processing source: %s", scraper.site_id)
+            try:
+                return scraper.scrape(limit=limit_per_site), None
+            except Exception as exc:  # noqa: BLE001
+                return [], exc
+
+        workers = max(1, min(self._max_workers, len(self._scrapers)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scraper") as executor:
+            for scraper, (items, error) in zip(self._scrapers, executor.map(scrape, self._scrapers)):
+                yield scraper, items, error
+
     def _send_summary(self, result: PipelineResult, *, dry_run: bool) -> None:
         notifier = getattr(self._slack, "notify_blocks", None)
         if not notifier:
@@ -190,11 +217,6 @@ class TrelloPipeline:
             logger.debug("Unable to send Slack summary notification.", exc_info=True)
 
 
-def _resolve_item_date(item: NewsItem) -> str:
-    candidate = _resolve_item_datetime(item)
-    return candidate.date().isoformat()
-
-
 def _resolve_item_datetime(item: NewsItem) -> datetime:
     candidate: datetime | None = item.published_at or item.retrieved_at
     if candidate is None:
@@ -133,7 +133,8 @@ def get_scraper_classes(site_ids: Sequence[str] | None = None) -> Iterable[Type[
 
     Args:
         site_ids: Optional list of site identifiers. When ``None`` all
-            registered scrapers are returned.
+            registered scrapers are returned. Repeated identifiers are
+            collapsed so each source is only scraped once.
 
     Raises:
         ValueError: If one or more identifiers are unknown.
@@ -142,6 +143,7 @@ def get_scraper_classes(site_ids: Sequence[str] | None = None) -> Iterable[Type[
     if site_ids is None:
         return _SCRAPER_REGISTRY.values()
 
+    site_ids = list(dict.fromkeys(site_ids))
     unknown = [site_id for site_id in site_ids if site_id not in _SCRAPER_REGISTRY]
     if unknown:
         joined = ", ".join(sorted(unknown))
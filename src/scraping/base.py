@@ -2,19 +2,23 @@
 from __future__ import annotations
 
 import logging
+import ssl
 import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Iterable, List, Optional
-from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from urllib.parse import urljoin
 
 import httpx
 from bs4 import BeautifulSoup
 
 from config import get_settings
-from models import NewsItem
+from models import NewsItem, normalize_url
 
 
 MAX_ITEMS_PER_SOURCE = 9
+# Statuses that will not change on retry; fail fast instead of sleeping.
+NON_RETRYABLE_STATUSES = frozenset({404, 410})
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +31,18 @@ class ScraperNoArticlesError(RuntimeError):
         self.site_id = site_id
 
 
+@lru_cache(maxsize=1)
+def _shared_ssl_context() -> ssl.SSLContext:
+    """Return an SSL context shared by every scraper client.
+
+    Building a context loads the CA bundle from disk, which dominates the cost
+    of creating an ``httpx.Client``; reusing one keeps start-up cheap when all
+    scrapers are instantiated together.
+    """
+
+    return httpx.create_ssl_context()
+
+
 class BaseScraper(ABC):
     """Reusable base scraper handling HTTP concerns and orchestration."""
 
@@ -37,10 +53,12 @@ class BaseScraper(ABC):
 
     def __init__(self) -> None:
         settings = get_settings().scraper
+        self._ssl_context = _shared_ssl_context()
         self._client = httpx.Client(
             headers={"User-Agent": settings.user_agent},
             timeout=settings.request_timeout,
             follow_redirects=True,
+            verify=self._ssl_context,
         )
         self._request_timeout = settings.request_timeout
         self._throttle_seconds = settings.throttle_seconds
@@ -93,51 +111,28 @@ class BaseScraper(ABC):
                     snippet,
                 )
                 last_exc = exc
-                sleep_time = self._throttle_seconds * attempt if self._throttle_seconds else attempt
-                time.sleep(sleep_time)
+                if exc.response is not None and exc.response.status_code in NON_RETRYABLE_STATUSES:
+                    break
+                self._sleep_before_retry(attempt)
             except Exception as exc:  # noqa: BLE001
                 last_exc = exc
-                sleep_time = self._throttle_seconds * attempt if self._throttle_seconds else attempt
-                time.sleep(sleep_time)
+                self._sleep_before_retry(attempt)
         if last_exc:
             raise last_exc
         raise RuntimeError(f"Failed to GET {url}")
 
+    def _sleep_before_retry(self, attempt: int) -> None:
+        if attempt >= self._max_retries:
+            return
+        sleep_time = self._throttle_seconds * attempt if self._throttle_seconds else attempt
+        time.sleep(sleep_time)
+
     def _get_soup(self, url: str) -> BeautifulSoup:
         response = self._get(url)
         return BeautifulSoup(response.text, "lxml")
 
     def _normalize_url(self, url: str) -> str:
-        absolute = urljoin(self.base_url, url)
-        try:
-            split = urlsplit(absolute)
-            scheme = split.scheme or "https"
-            netloc = (split.netloc or "").lower()
-            if netloc.endswith(":80") and scheme == "http":
-                netloc = netloc[:-3]
-            if netloc.endswith(":443") and scheme == "https":
-                netloc = netloc[:-4]
-
-            path = split.path or "/"
-            while "//" in path:
-                path = path.replace("//", "/")
-            if path != "/" and path.endswith("/"):
-                path = path[:-1]
-
-            params = []
-            for key, value in parse_qsl(split.query, keep_blank_values=False):
-                lowered = key.lower()
-                if lowered.startswith("utm_"):
-                    continue
-                if lowered in {"fbclid", "gclid", "yclid", "mc_cid", "mc_eid", "ref", "ref_src", "igshid"}:
-                    continue
-                params.append((key, value))
-            params.sort()
-            query = urlencode(params, doseq=True)
-
-            return urlunsplit((scheme, netloc, path, query, ""))
-        except Exception:  # noqa: BLE001
-            return absolute
+        return normalize_url(urljoin(self.base_url, url))
 
 
 __all__ = ["BaseScraper", "ScraperNoArticlesError"]
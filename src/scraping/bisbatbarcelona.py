@@ -116,6 +116,10 @@ _MONTH_MAP: dict[str, int] = {
 }
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_DAY_MONTH_YEAR_RE = re.compile(r"(\d{1,2})\s+([a-zà-ú]+)\s+(\d{4})")
+
+
 def _parse_date(container: Tag) -> datetime | None:
     if container is None:
         return None
@@ -128,12 +132,12 @@ def _parse_date(container: Tag) -> datetime | None:
     normalized = normalized.replace("\u00a0", " ")
     normalized = normalized.replace(",", " ")
     normalized = normalized.replace(".", " ")
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
     normalized = normalized.strip().lower()
     if not normalized:
         return None
 
-    match = re.search(r"(\d{1,2})\s+([a-zà-ú]+)\s+(\d{4})", normalized)
+    match = _DAY_MONTH_YEAR_RE.search(normalized)
     if match is None:
         return None
 
@@ -114,6 +114,10 @@ _MONTH_MAP: dict[str, int] = {
 }
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_YEAR_RE = re.compile(r"\d{4}")
+
+
 def _parse_date(article: Tag) -> datetime | None:
     data_box = article.select_one(".data")
     if data_box is None:
@@ -138,7 +142,7 @@ def _parse_date(article: Tag) -> datetime | None:
         return None
 
     year_text = year_node.get_text(" ", strip=True)
-    year_match = re.search(r"\d{4}", year_text)
+    year_match = _YEAR_RE.search(year_text)
     if year_match is None:
         return None
 
@@ -157,7 +161,7 @@ def _normalize_month(value: str) -> str:
     normalized = normalized.replace("de ", "")
     normalized = normalized.replace("del ", "")
     normalized = normalized.replace(".", " ")
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
     normalized = normalized.strip()
     normalized = normalized.lower()
     normalized = normalized.replace("ç", "c")
@@ -151,20 +151,22 @@ _MONTH_MAP: dict[str, int] = {
 }
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_DATE_CHAR_TABLE = str.maketrans(
+    {"\u2019": "'", "\u00a0": " ", ",": " ", ".": " ", "º": " ", "ª": " "}
+)
+_MONTH_KEY_TABLE = str.maketrans("", "", "'-")
+
+
 def _parse_date(value: str | None) -> datetime | None:
     if not value:
         return None
 
     normalized = unicodedata.normalize("NFKD", value)
-    normalized = normalized.replace("\u2019", "'")
-    normalized = normalized.replace("\u00a0", " ")
+    normalized = normalized.translate(_DATE_CHAR_TABLE)
     normalized = normalized.lower()
-    normalized = normalized.replace(",", " ")
-    normalized = normalized.replace(".", " ")
-    normalized = normalized.replace("º", " ")
-    normalized = normalized.replace("ª", " ")
     normalized = normalized.replace("er ", " ")
-    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized)
     normalized = normalized.strip()
     if not normalized:
         return None
@@ -198,8 +200,7 @@ def _parse_date(value: str | None) -> datetime | None:
 
     key = month_token
     key = key.strip()
-    key = key.replace("'", "")
-    key = key.replace("-", "")
+    key = key.translate(_MONTH_KEY_TABLE)
     key = unicodedata.normalize("NFKD", key)
     key = key.encode("ascii", "ignore").decode("ascii")
     key = key.lower()
@@ -66,12 +66,15 @@ class BisbatVicScraper(BaseScraper):
         return items
 
 
+_ONCLICK_HREF_RE = re.compile(r"location\.href=['\"]([^'\"]+)['\"]")
+
+
 def _extract_href(node: Tag | None) -> str | None:
     if node is None:
         return None
     onclick = node.get("onclick")
     if onclick:
-        match = re.search(r"location\.href=['\"]([^'\"]+)['\"]", onclick)
+        match = _ONCLICK_HREF_RE.search(onclick)
         if match:
             return match.group(1)
     about = node.get("about")
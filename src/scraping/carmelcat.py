@@ -100,12 +100,16 @@ def _extract_summary(heading: Tag) -> str:
     return " ".join(fragments)
 
 
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEPARATOR_RE = re.compile(r"[\s_-]+")
+
+
 def _slugify(value: str) -> str:
     normalized = unicodedata.normalize("NFKD", value)
     normalized = normalized.encode("ascii", "ignore").decode("ascii")
     normalized = normalized.lower()
-    normalized = re.sub(r"[^\w\s-]", "", normalized)
-    normalized = re.sub(r"[\s_-]+", "-", normalized).strip("-")
+    normalized = _SLUG_STRIP_RE.sub("", normalized)
+    normalized = _SLUG_SEPARATOR_RE.sub("-", normalized).strip("-")
     return normalized or "noticia"
 
 
@@ -9,7 +9,7 @@ from bs4 import BeautifulSoup
 
 from models import NewsItem, utcnow
 
-from .base import BaseScraper
+from .base import MAX_ITEMS_PER_SOURCE, BaseScraper
 
 
 class MaristesScraper(BaseScraper):
@@ -33,6 +33,10 @@ class MaristesScraper(BaseScraper):
             use_simple_iteration = True
 
         for card in cards:
+            # Each item costs an article fetch for its date; stop once scrape()
+            # would truncate anyway.
+            if len(items) >= MAX_ITEMS_PER_SOURCE:
+                break
             anchors = card.find_all("a", href=True)
             anchor = None
             for candidate in anchors:
@@ -81,6 +85,8 @@ class MaristesScraper(BaseScraper):
         if use_simple_iteration:
             # Fallback for fixtures / alternate markup: reuse original simple anchor iteration
             for anchor in listing_soup.select("a[href]"):
+                if len(items) >= MAX_ITEMS_PER_SOURCE:
+                    break
                 href = anchor.get("href", "").strip()
                 if not href or href.startswith("#"):
                     continue
@@ -10,7 +10,7 @@ from bs4 import BeautifulSoup, Tag
 
 from models import NewsItem, utcnow
 
-from .base import BaseScraper
+from .base import MAX_ITEMS_PER_SOURCE, BaseScraper
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,9 @@ class MigrastudiumScraper(BaseScraper):
         seen: set[str] = set()
 
         for article in listing_soup.select("article.post"):
+            # Undated cards need an article fetch; stop once scrape() would truncate.
+            if len(items) >= MAX_ITEMS_PER_SOURCE:
+                break
             anchor = article.select_one(".post-title a[href]")
             if anchor is None:
                 continue
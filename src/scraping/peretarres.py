@@ -32,6 +32,7 @@ class PeretarresScraper(BaseScraper):
                 pool=timeout.pool,
             ),
             follow_redirects=True,
+            verify=self._ssl_context,
         )
 
     def extract_items(self, listing_soup: BeautifulSoup) -> Iterable[NewsItem]:
@@ -71,7 +72,7 @@ class PeretarresScraper(BaseScraper):
         return items
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class _Entry:
     link: Tag
     date_text: str
@@ -80,6 +80,7 @@ _MONTHS = {
 }
 
 _DATE_RE = re.compile(r"(?P<day>\d{1,2})\s+d['e]?\s*(?P<month>[a-zà-ÿ]+)\s+d['e]?\s*(?P<year>\d{4})", re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9 ]+")
 
 
 def _parse_catalan_date(value: str | None) -> datetime | None:
@@ -96,7 +97,7 @@ def _parse_catalan_date(value: str | None) -> datetime | None:
         fallback = normalized
         fallback = fallback.replace(" d'", " ")
         fallback = fallback.replace(" de ", " ")
-        fallback = re.sub(r"[^a-z0-9 ]+", " ", fallback)
+        fallback = _NON_ALNUM_RE.sub(" ", fallback)
         parts = [part for part in fallback.split() if part]
         if len(parts) < 3:
             return None
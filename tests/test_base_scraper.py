@@ -0,0 +1,53 @@
+import httpx
+import pytest
+
+from scraping.base import BaseScraper
+
+
+class _DummyScraper(BaseScraper):
+    site_id = "dummy"
+    base_url = "https://example.com"
+    listing_url = "https://example.com/noticies"
+
+    def extract_items(self, listing_soup):
+        return []
+
+
+def _scraper_with_transport(monkeypatch, handler) -> tuple[_DummyScraper, list[float]]:
+    sleeps: list[float] = []
+    monkeypatch.setattr("scraping.base.time.sleep", sleeps.append)
+    scraper = _DummyScraper()
+    scraper._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return scraper, sleeps
+
+
+def test_get_fails_fast_on_not_found(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(404)
+
+    scraper, sleeps = _scraper_with_transport(monkeypatch, handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        scraper._get(scraper.listing_url)
+
+    assert len(calls) == 1
+    assert not sleeps
+
+
+def test_get_does_not_sleep_after_last_attempt(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(503)
+
+    scraper, sleeps = _scraper_with_transport(monkeypatch, handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        scraper._get(scraper.listing_url)
+
+    assert len(calls) == scraper._max_retries
+    assert len(sleeps) == scraper._max_retries - 1
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from bs4 import BeautifulSoup
 
+from scraping.base import MAX_ITEMS_PER_SOURCE
 from scraping.maristes import MaristesScraper
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -33,3 +34,28 @@ def test_extract_items_sets_metadata():
 
     assert item.metadata["base_url"] == scraper.base_url
     assert item.metadata["lang"] == scraper.default_lang
+
+
+def test_extract_items_stops_fetching_details_at_source_cap():
+    scraper = MaristesScraper()
+    total = MAX_ITEMS_PER_SOURCE + 3
+    cards = "".join(
+        f'<div class="llista-notis-item"><a href="/noticies/noticia-{index}">Notícia {index}</a></div>'
+        for index in range(total)
+    )
+    soup = BeautifulSoup(f"<html><body>{cards}</body></html>", "lxml")
+    all_urls = [f"https://www.maristes.cat/noticies/noticia-{index}" for index in range(total)]
+
+    fetched: list[str] = []
+
+    def fake_get_published_at(url):
+        fetched.append(url)
+        return None
+
+    scraper._get_published_at = fake_get_published_at
+
+    items = list(scraper.extract_items(soup))
+
+    assert len(fetched) == MAX_ITEMS_PER_SOURCE
+    assert fetched == all_urls[:MAX_ITEMS_PER_SOURCE]
+    assert [item.url for item in items] == all_urls[:MAX_ITEMS_PER_SOURCE]
@@ -3,6 +3,7 @@ from pathlib import Path
 
 from bs4 import BeautifulSoup
 
+from scraping.base import MAX_ITEMS_PER_SOURCE
 from scraping.migrastudium import MigrastudiumScraper
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -53,3 +54,28 @@ def test_extract_items_sets_metadata():
     assert item.metadata["base_url"] == scraper.base_url
     assert item.metadata["lang"] == scraper.default_lang
     assert item.metadata["published_at"] == "2025-11-25T00:00:00+00:00"
+
+
+def test_extract_items_stops_fetching_details_at_source_cap():
+    scraper = MigrastudiumScraper()
+    total = MAX_ITEMS_PER_SOURCE + 3
+    articles = "".join(
+        f'<article class="post"><h2 class="post-title"><a href="/actualitat/noticia-{index}">Notícia {index}</a></h2></article>'
+        for index in range(total)
+    )
+    soup = BeautifulSoup(f"<html><body>{articles}</body></html>", "lxml")
+    all_urls = [f"https://www.migrastudium.org/actualitat/noticia-{index}" for index in range(total)]
+
+    fetched: list[str] = []
+
+    def fake_fetch(url):
+        fetched.append(url)
+        return datetime(2025, 11, 25, tzinfo=timezone.utc)
+
+    scraper._fetch_published_at = fake_fetch
+
+    items = list(scraper.extract_items(soup))
+
+    assert len(fetched) == MAX_ITEMS_PER_SOURCE
+    assert fetched == all_urls[:MAX_ITEMS_PER_SOURCE]
+    assert [item.url for item in items] == all_urls[:MAX_ITEMS_PER_SOURCE]
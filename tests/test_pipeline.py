@@ -186,3 +186,37 @@ def test_pipeline_skips_stale_items():
     assert result.skipped_stale == 1
     assert len(trello.created) == 1
     assert len(sheets.appended) == 1
+
+
+class FailingScraper:
+    def __init__(self, site_id: str) -> None:
+        self.site_id = site_id
+
+    def scrape(self, limit=None):
+        raise RuntimeError("boom")
+
+
+def test_pipeline_isolates_failing_scrapers_when_concurrent():
+    scrapers = [
+        StubScraper("salesians", [_news_item("https://example.com/a")]),
+        FailingScraper("jesuites"),
+        StubScraper("maristes", [_news_item("https://example.com/b", source="maristes")]),
+    ]
+    sheets = StubSheets()
+    trello = StubTrello()
+    slack = StubSlack()
+
+    pipeline = TrelloPipeline(
+        scrapers=scrapers,
+        trello_client=trello,
+        sheets_repo=sheets,
+        slack_notifier=slack,
+        max_workers=3,
+    )
+    result = pipeline.run(live_run=False)
+
+    assert result.sources_processed == 2
+    assert result.new_items == 2
+    assert result.alerts_sent == 1
+    assert "jesuites" in slack.messages[0]
+    assert len(trello.created) == 2
@@ -0,0 +1,16 @@
+import pytest
+
+from scraping import instantiate_scrapers
+from scraping.acat import ACATScraper
+from scraping.iqs import IQSScraper
+
+
+def test_instantiate_scrapers_collapses_repeated_ids_in_first_seen_order():
+    scrapers = instantiate_scrapers(["iqs", "iqs", "acat"])
+
+    assert [type(scraper) for scraper in scrapers] == [IQSScraper, ACATScraper]
+
+
+def test_instantiate_scrapers_rejects_unknown_ids():
+    with pytest.raises(ValueError, match="does-not-exist"):
+        instantiate_scrapers(["iqs", "does-not-exist", "iqs"])
@@ -23,12 +23,12 @@ def test_notify_webhook_defaults_to_public_channel(monkeypatch):
         calls["timeout"] = timeout
         return _DummyResponse()
 
-    monkeypatch.setattr("integrations.slack.httpx.post", fake_post)
     dummy_settings = SimpleNamespace(
         slack=SlackSettings(webhook_url="https://hooks.slack.test", bot_token=None)
     )
     monkeypatch.setattr("integrations.slack.get_settings", lambda: dummy_settings)
     notifier = SlackNotifier()
+    monkeypatch.setattr(notifier._http, "post", fake_post)
 
     notifier.notify("Incidència detectada")
 
@@ -48,10 +48,10 @@ def test_notify_api_targets_channel(monkeypatch):
         captured["timeout"] = timeout
         return _DummyResponse()
 
-    monkeypatch.setattr("integrations.slack.httpx.post", fake_post)
     dummy_settings = SimpleNamespace(slack=SlackSettings(webhook_url=None, bot_token="xoxb-test"))
     monkeypatch.setattr("integrations.slack.get_settings", lambda: dummy_settings)
     notifier = SlackNotifier()
+    monkeypatch.setattr(notifier._http, "post", fake_post)
 
     notifier.notify("Missatge directe")
 
@@ -71,10 +71,10 @@ def test_notify_blocks_via_api(monkeypatch):
         captured["timeout"] = timeout
         return _DummyResponse()
 
-    monkeypatch.setattr("integrations.slack.httpx.post", fake_post)
     dummy_settings = SimpleNamespace(slack=SlackSettings(webhook_url=None, bot_token="xoxb-test"))
     monkeypatch.setattr("integrations.slack.get_settings", lambda: dummy_settings)
     notifier = SlackNotifier()
+    monkeypatch.setattr(notifier._http, "post", fake_post)
 
     blocks = [{"type": "section", "text": {"type": "plain_text", "text": "Hola"}}]
     notifier.notify_blocks(blocks=blocks, text="Resum")
@@ -93,12 +93,12 @@ def test_notify_blocks_via_webhook(monkeypatch):
         captured["timeout"] = timeout
         return _DummyResponse()
 
-    monkeypatch.setattr("integrations.slack.httpx.post", fake_post)
     dummy_settings = SimpleNamespace(
         slack=SlackSettings(webhook_url="https://hooks.slack.test", bot_token=None)
     )
     monkeypatch.setattr("integrations.slack.get_settings", lambda: dummy_settings)
     notifier = SlackNotifier()
+    monkeypatch.setattr(notifier._http, "post", fake_post)
 
     blocks = [{"type": "section", "text": {"type": "plain_text", "text": "Hola"}}]
     notifier.notify_blocks(blocks=blocks, text="Resum")
@@ -118,12 +118,12 @@ def test_notify_webhook_channel_override_for_text(monkeypatch):
         captured["timeout"] = timeout
         return _DummyResponse()
 
-    monkeypatch.setattr("integrations.slack.httpx.post", fake_post)
     dummy_settings = SimpleNamespace(
         slack=SlackSettings(webhook_url="https://hooks.slack.test", bot_token=None)
     )
     monkeypatch.setattr("integrations.slack.get_settings", lambda: dummy_settings)
     notifier = SlackNotifier()
+    monkeypatch.setattr(notifier._http, "post", fake_post)
 
     notifier.notify("Incidència detectada")
 
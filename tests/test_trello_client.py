@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+import json
+
+import httpx
+import pytest
+
+from config import TrelloSettings
+from integrations.trello import TrelloClient
+from models import NewsItem
+
+
+def _settings() -> TrelloSettings:
+    return TrelloSettings(api_key="key", token="token", board_id="board", list_id="list")
+
+
+def _item() -> NewsItem:
+    return NewsItem(
+        source="salesians",
+        title="Notícia",
+        url="https://example.com/a",
+        published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_create_card_attaches_url_in_single_request():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/labels") and request.method == "GET":
+            return httpx.Response(200, json=[{"id": "label-1", "name": "salesians"}])
+        return httpx.Response(200, json={"id": "card-1"})
+
+    client = TrelloClient(settings=_settings())
+    client._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+    card_id = client.create_card(_item())
+
+    assert card_id == "card-1"
+    card_requests = [request for request in requests if request.method == "POST"]
+    assert len(card_requests) == 1
+    label_request = next(request for request in requests if request.method == "GET")
+    assert label_request.url.params["fields"] == "name"
+    payload = json.loads(card_requests[0].content)
+    assert payload["urlSource"] == "https://example.com/a"
+    assert payload["idLabels"] == ["label-1"]
+
+
+def test_request_retries_rate_limited_calls(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr("integrations.trello.time.sleep", sleeps.append)
+    responses = iter([httpx.Response(429), httpx.Response(429), httpx.Response(200, json={"id": "card-1"})])
+
+    client = TrelloClient(settings=_settings())
+    client._http = httpx.Client(transport=httpx.MockTransport(lambda request: next(responses)))
+
+    response = client._request("POST", "/cards", json={"name": "Notícia"})
+
+    assert response.json() == {"id": "card-1"}
+    assert len(sleeps) == 2
+    assert sleeps[0] < sleeps[1]
+
+
+def test_request_does_not_retry_server_errors(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr("integrations.trello.time.sleep", sleeps.append)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(500)
+
+    client = TrelloClient(settings=_settings())
+    client._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client._request("POST", "/cards", json={"name": "Notícia"})
+
+    assert len(calls) == 1
+    assert not sleeps